@@ -4,52 +4,137 @@ Flask backend with African optimization and cultural integration
 """
 
 from flask import Flask, jsonify, request
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
-from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+import json
 import os
+import sqlite3
+import time
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; Flask's stdlib encoder is used without it
+    orjson = None
+else:
+    # Dates are passed through to Flask's default handler to keep its HTTP-date format
+    ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+def parse_list_env(name, default):
+    """Read a list from a JSON array or comma-separated environment variable"""
+    value = os.getenv(name, '').strip()
+    if not value:
+        return default
+    if value.startswith('[') and value.endswith(']'):
+        return json.loads(value)
+    return [item for item in (token.strip() for token in value.split(',')) if item]
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider that encodes compact, UTF-8 responses with orjson (request parsing is unchanged)"""
+
+    # orjson never escapes non-ASCII; setting this back to True switches to Flask's encoder
+    ensure_ascii = False
+
+    def dumps(self, obj, **kwargs):
+        # Other options (e.g. debug indent), ASCII escaping and values orjson can't encode
+        # (e.g. ints beyond 64 bits) use Flask's encoder
+        if self.ensure_ascii or kwargs not in ({}, {'separators': (',', ':')}):
+            return super().dumps(obj, **kwargs)
+        option = ORJSON_OPTIONS | orjson.OPT_SORT_KEYS if self.sort_keys else ORJSON_OPTIONS
+        try:
+            return orjson.dumps(obj, default=self.default, option=option).decode()
+        except TypeError:
+            return super().dumps(obj, **kwargs)
 
 # Initialize Flask app
 app = Flask(__name__)
+if orjson is not None:
+    app.json = ORJSONProvider(app)
 
-# Enable CORS for African mobile apps
-CORS(app, origins="*")
+# Enable CORS for African mobile apps (preflights are cached by the browser)
+CORS(app, origins=parse_list_env('CORS_ORIGINS', '*'), max_age=int(os.getenv('CORS_MAX_AGE', '86400')))
 
 # Configuration
 app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL', 'sqlite:///webwaka_agriculture.db')
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    # Recycling bounds connection staleness, so the per-checkout pre-ping is opt-in
+    'pool_recycle': int(os.getenv('DATABASE_POOL_RECYCLE', '3600')),
+    'pool_pre_ping': os.getenv('DATABASE_PRE_PING', 'false').lower() == 'true'
+}
+if not app.config['SQLALCHEMY_DATABASE_URI'].startswith('sqlite'):
+    # Size the server database pool for burst load (SQLite pools don't take these)
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'].update({
+        'pool_size': int(os.getenv('DATABASE_POOL_SIZE', '20')),
+        'max_overflow': int(os.getenv('DATABASE_MAX_OVERFLOW', '40')),
+        'pool_timeout': int(os.getenv('DATABASE_POOL_TIMEOUT', '10'))
+    })
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'webwaka-agriculture-secret-key')
 
-# Initialize database
-db = SQLAlchemy(app)
+# Tune SQLite (the default offline-friendly database) in one call per new connection
+@event.listens_for(Engine, 'connect')
+def set_sqlite_pragma(dbapi_connection, connection_record):
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        dbapi_connection.executescript(
+            'PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; PRAGMA foreign_keys=ON; '
+            'PRAGMA temp_store=MEMORY; PRAGMA cache_size=10000;'
+        )
 
-# Import models and routes
-from models.agriculture_models import *
+# Initialize database (models own the single SQLAlchemy instance)
+from models.agriculture_models import db
+db.init_app(app)
+
+# Import routes
 from routes.agriculture_routes import bp as agriculture_bp
 
 # Register blueprints
 app.register_blueprint(agriculture_bp, url_prefix='/api/agriculture')
 
+# Static payloads are serialized once instead of on every request
+HEALTH_BODY = app.json.dumps({'status': 'healthy', 'sector': 'agriculture', 'african_optimized': True}).encode()
+ROOT_BODY = app.json.dumps({
+    'message': 'WebWaka Agriculture Sector API',
+    'version': '1.0.0',
+    'african_optimized': True,
+    'mobile_first': True,
+    'offline_support': True,
+    'cultural_integration': True
+}).encode()
+
 # Health check endpoint
 @app.route('/health')
 def health_check():
-    return jsonify({'status': 'healthy', 'sector': 'agriculture', 'african_optimized': True})
+    return app.response_class(HEALTH_BODY, mimetype='application/json')
+
+# Probe results are reused briefly so frequent probers don't load the database
+READY_CACHE_SECONDS = float(os.getenv('READY_CACHE_SECONDS', '5'))
+ready_cache = {'checked_at': None, 'connected': False}
 
 # Ready check endpoint
 @app.route('/ready')
 def ready_check():
+    now = time.monotonic()
+    if ready_cache['checked_at'] is None or now - ready_cache['checked_at'] >= READY_CACHE_SECONDS:
+        try:
+            # Probe on a bare engine connection to skip ORM session setup
+            with db.engine.connect() as connection:
+                connection.execute(text('SELECT 1'))
+            ready_cache['connected'] = True
+        except Exception:
+            # Connection errors can name the database host and user, so keep them server-side
+            app.logger.exception('Readiness database probe failed')
+            ready_cache['connected'] = False
+        ready_cache['checked_at'] = now
+
+    if not ready_cache['connected']:
+        return jsonify({'status': 'not_ready', 'sector': 'agriculture', 'database': 'disconnected'}), 503
     return jsonify({'status': 'ready', 'sector': 'agriculture', 'database': 'connected'})
 
 # Root endpoint
 @app.route('/')
 def root():
-    return jsonify({
-        'message': 'WebWaka Agriculture Sector API',
-        'version': '1.0.0',
-        'african_optimized': True,
-        'mobile_first': True,
-        'offline_support': True,
-        'cultural_integration': True
-    })
+    return app.response_class(ROOT_BODY, mimetype='application/json')
 
 if __name__ == '__main__':
     # Create database tables
@@ -6,6 +6,7 @@ Comprehensive data models with African optimization and cultural integration
 from flask_sqlalchemy import SQLAlchemy
 from datetime import datetime
 from enum import Enum
+from types import MappingProxyType
 import json
 
 db = SQLAlchemy()
@@ -13,7 +14,15 @@ db = SQLAlchemy()
 class AgricultureEntity(db.Model):
     """Main entity for agriculture sector with African optimization"""
     __tablename__ = 'agriculture_entities'
-    
+    __table_args__ = (
+        # Endorsed entities are the minority, so index only those rows; other
+        # databases can't make it partial and would just duplicate the primary key
+        db.Index('idx_agriculture_traditional_endorsed', 'id',
+                 postgresql_where=db.text('traditional_authority_endorsement'),
+                 sqlite_where=db.text('traditional_authority_endorsement = 1')
+                 ).ddl_if(dialect=('postgresql', 'sqlite')),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(200), nullable=False)
     description = db.Column(db.Text)
@@ -21,14 +30,14 @@ class AgricultureEntity(db.Model):
     # African optimization fields
     traditional_name = db.Column(db.String(200))
     local_language = db.Column(db.String(50))
-    community_approval = db.Column(db.Boolean, default=False)
-    traditional_authority_endorsement = db.Column(db.Boolean, default=False)
+    community_approval = db.Column(db.Boolean, default=False, server_default=db.false())
+    traditional_authority_endorsement = db.Column(db.Boolean, default=False, server_default=db.false())
     cultural_significance = db.Column(db.Text)
     
     # Mobile optimization
-    mobile_optimized = db.Column(db.Boolean, default=True)
-    offline_sync_enabled = db.Column(db.Boolean, default=True)
-    mobile_money_supported = db.Column(db.Boolean, default=True)
+    mobile_optimized = db.Column(db.Boolean, default=True, server_default=db.true())
+    offline_sync_enabled = db.Column(db.Boolean, default=True, server_default=db.true())
+    mobile_money_supported = db.Column(db.Boolean, default=True, server_default=db.true())
     
     # Timestamps
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -52,14 +61,15 @@ class AgricultureEntity(db.Model):
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
 
+# Supported local languages (English is the default)
+LANGUAGE_NAMES = MappingProxyType({
+    'en': 'English',
+    'ig': 'Igbo',
+    'yo': 'Yoruba',
+    'ha': 'Hausa'
+})
+
 # Utility functions for African optimization
 def format_for_mobile(data, language='en'):
     """Format data for mobile display with African optimization"""
-    if language == 'ig':  # Igbo
-        return {'sector': 'Agriculture', 'language': 'Igbo'}
-    elif language == 'yo':  # Yoruba
-        return {'sector': 'Agriculture', 'language': 'Yoruba'}
-    elif language == 'ha':  # Hausa
-        return {'sector': 'Agriculture', 'language': 'Hausa'}
-    else:  # English default
-        return {'sector': 'Agriculture', 'language': 'English'}
+    return {'sector': 'Agriculture', 'language': LANGUAGE_NAMES.get(language, 'English')}